@@ -1,16 +1,31 @@
+import re
 import time
+import queue
+import itertools
 import threading
 import subprocess
 import json
-import os
-from datetime import datetime
+import pathlib
+import tkinter as tk
 import customtkinter as ctk
-from escpos.printer import Usb
+
+# pyudev is optional: with it we get instant hotplug events,
+# without it we fall back to polling lsusb
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# orjson is optional too: faster config parse at startup when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # -------------------------------
 # CONFIG FILE
 # -------------------------------
-CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "printer_config.json")
+CONFIG_FILE = pathlib.Path(__file__).resolve().parent / "printer_config.json"
 
 DEFAULT_CONFIG = {
     "vendor_id": "0x0fe6",
@@ -23,30 +38,30 @@ DEFAULT_CONFIG = {
 def load_config():
     """Load configuration from file or return defaults"""
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults for any missing keys
-                for key in DEFAULT_CONFIG:
-                    if key not in config:
-                        config[key] = DEFAULT_CONFIG[key]
-                return config
+        data = CONFIG_FILE.read_bytes()
+        loaded = orjson.loads(data) if orjson is not None else json.loads(data)
+        # Defaults fill in any missing keys
+        return {**DEFAULT_CONFIG, **loaded}
     except Exception:
         pass
     return DEFAULT_CONFIG.copy()
 
 def save_config(config):
-    """Save configuration to file"""
+    """Save configuration to file (atomically, via a temp file)"""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode()
+        # Write beside the target then rename, so a crash mid-save can
+        # never leave a truncated config behind
+        tmp = CONFIG_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(CONFIG_FILE)
         return True
     except Exception:
         return False
 
-# Load config at startup
-CONFIG = load_config()
-
 # -------------------------------
 # Golden Ratio Spacing System (Fibonacci)
 # -------------------------------
@@ -80,56 +95,125 @@ COLORS = {
 }
 
 # -------------------------------
-# Helper: thread-safe popup
+# ESC/POS fragments shared by the receipt builders, encoded once at
+# import (cp437 matches the printer's default code page)
+# -------------------------------
+ESC_BOLD_ON = b'\x1b\x45\x01'
+ESC_BOLD_OFF = b'\x1b\x45\x00'
+ESC_ALIGN_C = b'\x1ba\x01'
+ESC_ALIGN_L = b'\x1ba\x00'
+ESC_SIZE_2 = b'\x1d!\x11'
+ESC_SIZE_1 = b'\x1d!\x00'
+ESC_CUT = b'\x1dVA\x10'
+RCPT_SEP = b"-------------------------\n"
+RCPT_TITLE = ESC_BOLD_ON + b"LAPORAN HITUNGAN\n" + ESC_BOLD_OFF
+RCPT_FOOTER = "Terima kasih!\nDicetak oleh PrinterPro\n\n".encode('cp437', 'replace')
+TEST_TITLE = ESC_BOLD_ON + b"TEST PRINT\n" + ESC_BOLD_OFF
+TEST_OK = ESC_BOLD_ON + b"Test berhasil!\n" + ESC_BOLD_OFF + b"\n"
+
+# -------------------------------
+# Shared fonts - CTkFont needs a Tk root, so instances are memoized per
+# (size, weight, family) the first time a widget asks for them
+# -------------------------------
+FONTS = {}
+
+def _f(size, weight="normal", family=None):
+    """One shared CTkFont per distinct (size, weight, family)"""
+    k = (size, weight, family)
+    f = FONTS.get(k)
+    if f is None:
+        kwargs = {"size": size, "weight": weight}
+        if family:
+            kwargs["family"] = family
+        f = FONTS[k] = ctk.CTkFont(**kwargs)
+    return f
+
+# -------------------------------
+# Helper: thread-safe popup (one hidden window per parent, reused)
 # -------------------------------
+class _PopupWindow(ctk.CTkToplevel):
+    """A popup that is built once and reconfigured per message"""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.geometry("377x200")
+        self.configure(fg_color=COLORS["bg_card"])
+        self.resizable(False, False)
+        self.transient(master)
+        self.withdraw()
+        self.protocol("WM_DELETE_WINDOW", self._dismiss)
+
+        self.indicator = ctk.CTkFrame(
+            self,
+            fg_color=COLORS["text_secondary"],
+            height=4,
+            corner_radius=0
+        )
+        self.indicator.pack(fill="x")
+
+        self.title_lbl = ctk.CTkLabel(
+            self,
+            text="",
+            font=_f(12, "bold"),
+            text_color=COLORS["text_secondary"]
+        )
+        self.title_lbl.pack(pady=(SPACE["xl"], SPACE["md"]))
+
+        self.msg_lbl = ctk.CTkLabel(
+            self,
+            text="",
+            wraplength=int(377 - SPACE["xxl"] * 2),
+            justify="center",
+            font=_f(13),
+            text_color=COLORS["text_primary"]
+        )
+        self.msg_lbl.pack(pady=(0, SPACE["xl"]), padx=SPACE["xl"])
+
+        btn = ctk.CTkButton(
+            self,
+            text="OK",
+            command=self._dismiss,
+            fg_color=COLORS["border"],
+            hover_color=COLORS["bg_sidebar"],
+            font=_f(13, "bold"),
+            height=SPACE["xxl"],
+            width=100,
+            corner_radius=SPACE["sm"]
+        )
+        btn.pack(pady=(0, SPACE["xl"]))
+
+    def _dismiss(self):
+        try:
+            self.grab_release()
+        except Exception:
+            pass
+        self.withdraw()
+
+    def show(self, title, message, popup_type="info"):
+        indicator_colors = {"success": COLORS["success"], "error": COLORS["accent"], "info": COLORS["warning"]}
+        color = indicator_colors.get(popup_type, COLORS["text_secondary"])
+
+        self.title(title)
+        self.indicator.configure(fg_color=color)
+        self.title_lbl.configure(text=title.upper(), text_color=color)
+        self.msg_lbl.configure(text=message)
+
+        self.deiconify()
+        self.lift()
+        try:
+            self.wait_visibility()
+            self.grab_set()
+        except Exception:
+            pass
+
 def _make_popup(master, title, message, popup_type="info"):
-    win = ctk.CTkToplevel(master)
-    win.title(title)
-    win.geometry("377x200")
-    win.configure(fg_color=COLORS["bg_card"])
-    win.wait_visibility()
-    win.grab_set()
-    
-    indicator_colors = {"success": COLORS["success"], "error": COLORS["accent"], "info": COLORS["warning"]}
-    
-    indicator = ctk.CTkFrame(
-        win, 
-        fg_color=indicator_colors.get(popup_type, COLORS["text_secondary"]),
-        height=4,
-        corner_radius=0
-    )
-    indicator.pack(fill="x")
-    
-    title_lbl = ctk.CTkLabel(
-        win, 
-        text=title.upper(),
-        font=ctk.CTkFont(size=12, weight="bold"),
-        text_color=indicator_colors.get(popup_type, COLORS["text_secondary"])
-    )
-    title_lbl.pack(pady=(SPACE["xl"], SPACE["md"]))
-    
-    lbl = ctk.CTkLabel(
-        win, 
-        text=message, 
-        wraplength=int(377 - SPACE["xxl"] * 2), 
-        justify="center",
-        font=ctk.CTkFont(size=13),
-        text_color=COLORS["text_primary"]
-    )
-    lbl.pack(pady=(0, SPACE["xl"]), padx=SPACE["xl"])
-    
-    btn = ctk.CTkButton(
-        win, 
-        text="OK", 
-        command=win.destroy,
-        fg_color=COLORS["border"],
-        hover_color=COLORS["bg_sidebar"],
-        font=ctk.CTkFont(size=13, weight="bold"),
-        height=SPACE["xxl"],
-        width=100,
-        corner_radius=SPACE["sm"]
-    )
-    btn.pack(pady=(0, SPACE["xl"]))
+    """Show the shared popup for master's toplevel, creating it on first use"""
+    root = master.winfo_toplevel()
+    popup = getattr(root, "_shared_popup", None)
+    if popup is None or not popup.winfo_exists():
+        popup = _PopupWindow(root)
+        root._shared_popup = popup
+    popup.show(title, message, popup_type)
 
 # -------------------------------
 # Main App
@@ -139,55 +223,94 @@ class PrinterApp(ctk.CTk):
         super().__init__()
 
         ctk.set_appearance_mode("dark")
-        
+
         self.title("Printer Dashboard")
         self.geometry("890x550")
         self.configure(fg_color=COLORS["bg_dark"])
         self.resizable(False, False)
 
         # Load config
-        self.config = CONFIG.copy()
-        
+        self.config = load_config()
+        self._refresh_id_cache()
+
         # State
         self.counter = 0
+        # Drives both counter labels via textvariable; setting it once
+        # updates them without widget configure() calls
+        self._counter_var = tk.StringVar(value="0")
         self.printer = None
-        self.auto_thread = None
+        # Capabilities probed once per connection in connect_printer()
+        self._supports_setsize = False
+        self._supports_raw = False
+        # Seeded from wall time so IDs stay human-meaningful, but
+        # incremented locally so rapid prints never collide
+        self._order_seq = itertools.count(int(time.time()))
+        self._last_ui_flush = 0.0
         self.auto_running = False
+        self._auto_after_id = None
+        self._auto_disc_ticks = 0
         self._stopped_by_user = False
-        self.print_lock = threading.Lock()
-        self.print_scheduled = False
-        self._ui_lock = threading.Lock()
+        # "idle"/"busy": written only by the printer worker, read by the
+        # UI thread for busy feedback — no lock needed
+        self._printer_state = "idle"
         self.current_mode = "Manual"
         self.device_connected = False
-        
+        self._udev_context = None
+        self._udev_observer = None
+        self._usb_poll_ms = 3000
+        self._usb_after_id = None
+        self._last_usb_state = None
+        self._usb_pattern_re = None
+        self._settings_win = None
+
         # Auto mode settings from config
         self.auto_max_count = self.config.get("auto_max_count", 10)
         self.auto_interval = self.config.get("auto_interval", 1.0)
 
+        # Printer worker: all printer I/O happens on this one thread,
+        # fed through a queue so button presses never block the UI
+        self._print_q = queue.Queue()
+        self._printer_thread = threading.Thread(target=self._printer_worker, daemon=True)
+        self._printer_thread.start()
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         self._build_ui()
-        
+
         # Start USB monitoring
         self._start_usb_monitor()
 
-    def _get_vendor_id(self):
-        """Get vendor ID as integer"""
+    def _refresh_id_cache(self):
+        """Parse the configured IDs once; callers read the cached values"""
         try:
             vid = self.config.get("vendor_id", "0x0fe6")
-            return int(vid, 16) if isinstance(vid, str) else vid
+            self._vid_int = int(vid, 16) if isinstance(vid, str) else vid
         except:
-            return 0x0fe6
-
-    def _get_product_id(self):
-        """Get product ID as integer"""
+            self._vid_int = 0x0fe6
         try:
             pid = self.config.get("product_id", "0x811e")
-            return int(pid, 16) if isinstance(pid, str) else pid
+            self._pid_int = int(pid, 16) if isinstance(pid, str) else pid
+        except:
+            self._pid_int = 0x811e
+        try:
+            self._iface_int = int(self.config.get("interface", 0))
         except:
-            return 0x811e
+            self._iface_int = 0
+        # 4-digit lowercase hex, as udev and lsusb report them
+        self._vid_str = "%04x" % self._vid_int
+        self._pid_str = "%04x" % self._pid_int
+
+    def _get_vendor_id(self):
+        """Get vendor ID as integer"""
+        return self._vid_int
+
+    def _get_product_id(self):
+        """Get product ID as integer"""
+        return self._pid_int
 
     def _get_interface(self):
         """Get interface number"""
-        return self.config.get("interface", 0)
+        return self._iface_int
 
     # -----------------------------
     # USB Device Detection
@@ -195,40 +318,101 @@ class PrinterApp(ctk.CTk):
     def _check_usb_device(self):
         """Check if USB device is connected using lsusb"""
         try:
-            vid = self.config.get("vendor_id", "0x0fe6").replace("0x", "").lower()
-            pid = self.config.get("product_id", "0x811e").replace("0x", "").lower()
-            search_pattern = f"{vid}:{pid}"
-            
+            # Compile the search pattern once; save_settings invalidates it
+            if self._usb_pattern_re is None:
+                self._usb_pattern_re = re.compile(
+                    rb'ID\s+' + self._vid_str.encode() + b':' + self._pid_str.encode(),
+                    re.IGNORECASE
+                )
+
             result = subprocess.run(
                 ["lsusb"],
                 capture_output=True,
-                text=True,
                 timeout=5
             )
-            
-            return search_pattern in result.stdout.lower()
+
+            return bool(self._usb_pattern_re.search(result.stdout))
         except Exception:
             return False
 
+    def _usb_id_strings(self):
+        """Vendor/product IDs as the 4-digit hex strings udev reports"""
+        return self._vid_str, self._pid_str
+
+    def _scan_usb_devices(self):
+        """One-shot scan of currently attached USB devices via pyudev"""
+        vid, pid = self._usb_id_strings()
+        try:
+            for device in self._udev_context.list_devices(subsystem='usb'):
+                if device.get('ID_VENDOR_ID') == vid and device.get('ID_MODEL_ID') == pid:
+                    return True
+        except Exception:
+            pass
+        return False
+
+    def _udev_event(self, device):
+        """Handle a udev hotplug event (runs on the observer thread)"""
+        if device.action not in ('add', 'remove'):
+            return
+        vid, pid = self._usb_id_strings()
+        if device.get('ID_VENDOR_ID') == vid and device.get('ID_MODEL_ID') == pid:
+            self.after(0, self._set_device_status, device.action == 'add')
+
     def _start_usb_monitor(self):
-        """Start periodic USB device monitoring"""
+        """Start USB device monitoring (hotplug events, or polling as fallback)"""
+        if pyudev is not None:
+            try:
+                self._udev_context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(self._udev_context)
+                monitor.filter_by('usb')
+                self._udev_observer = pyudev.MonitorObserver(monitor, callback=self._udev_event)
+                self._udev_observer.start()
+                # Initial state: scan once instead of waiting for an event
+                self._set_device_status(self._scan_usb_devices())
+                return
+            except Exception:
+                self._udev_context = None
+                self._udev_observer = None
+        # Fallback: periodic lsusb polling
         self._update_usb_status()
 
     def _update_usb_status(self):
         """Update USB connection status"""
         def check():
             connected = self._check_usb_device()
-            self.after(0, lambda: self._set_device_status(connected))
+            self.after(0, self._set_device_status, connected)
         
         # Run check in thread to avoid blocking UI
         threading.Thread(target=check, daemon=True).start()
-        
-        # Schedule next check in 3 seconds
-        self.after(3000, self._update_usb_status)
+
+        # Schedule next check; interval backs off while state is stable
+        self._usb_after_id = self.after(self._usb_poll_ms, self._update_usb_status)
+
+    def _reset_usb_poll(self):
+        """Drop the poll interval back to its minimum after UI activity"""
+        self._usb_poll_ms = 3000
+        # A backed-off poll may be up to 30s out; cancel it and check
+        # right away so UI activity sees fresh device state
+        if self._usb_after_id is not None:
+            try:
+                self.after_cancel(self._usb_after_id)
+            except Exception:
+                pass
+            self._usb_after_id = None
+            self._update_usb_status()
 
     def _set_device_status(self, connected):
         """Update UI based on device connection status"""
+        # Back off the polling interval while the state is stable, and
+        # skip the widget reconfigures entirely when nothing changed
+        if connected == self._last_usb_state:
+            self._usb_poll_ms = min(self._usb_poll_ms * 2, 30000)
+            return
+        self._usb_poll_ms = 3000
+        self._last_usb_state = connected
+
         self.device_connected = connected
+        self._refresh_dashboard()
         if connected:
             self.status_dot.configure(fg_color=COLORS["success"])
             self.status_label.configure(text="Connected", text_color=COLORS["success"])
@@ -247,55 +431,104 @@ class PrinterApp(ctk.CTk):
     # Printer connection
     # -----------------------------
     def connect_printer(self):
+        # Runs on the printer worker; the poll timers belong to the Tk
+        # thread, so hop over rather than touching them directly
+        self.after(0, self._reset_usb_poll)
         if self.printer is not None:
             return True
             
         try:
+            # Imported lazily: pulls in pyusb/PIL, which is noticeable at
+            # startup and wasted in sessions that never print
+            from escpos.printer import Usb
+
             self.printer = Usb(
                 self._get_vendor_id(),
                 self._get_product_id(),
                 self._get_interface()
             )
-            self._set_device_status(True)
+            self._probe_capabilities()
+            self.after(0, self._set_device_status, True)
             return True
         except Exception as e:
             err_msg = str(e)
-            self.after(0, lambda: _make_popup(self, "Connection Error", f"Gagal terhubung ke printer:\n{err_msg}", "error"))
+            self.after(0, _make_popup, self, "Connection Error", f"Gagal terhubung ke printer:\n{err_msg}", "error")
             self.printer = None
             return False
 
+    def _probe_capabilities(self):
+        """Probe driver features once so print paths can branch on flags"""
+        p = self.printer
+        try:
+            p.set(align="center", width=1, height=1)
+            self._supports_setsize = True
+        except Exception:
+            self._supports_setsize = False
+        try:
+            p._raw(b'')
+            self._supports_raw = True
+        except Exception:
+            self._supports_raw = False
+
     def _update_status(self, status):
-        if status == "connected":
-            self.status_dot.configure(fg_color=COLORS["success"])
-            self.status_label.configure(text="Connected", text_color=COLORS["success"])
-        else:
-            self.status_dot.configure(fg_color=COLORS["accent"])
-            self.status_label.configure(text="Disconnected", text_color=COLORS["accent"])
+        self._set_device_status(status == "connected")
 
     # -----------------------------
     # Settings Window
     # -----------------------------
     def _open_settings(self):
-        """Open configuration window"""
-        settings_win = ctk.CTkToplevel(self)
-        settings_win.title("Settings")
-        settings_win.geometry("450x400")
-        settings_win.configure(fg_color=COLORS["bg_dark"])
-        settings_win.wait_visibility()
-        settings_win.grab_set()
-        settings_win.resizable(False, False)
+        """Open the configuration window (built once, then reused)"""
+        if self._settings_win is None or not self._settings_win.winfo_exists():
+            self._build_settings_window()
+        self._refresh_settings_entries()
+        win = self._settings_win
+        win.deiconify()
+        win.lift()
+        try:
+            win.wait_visibility()
+            win.grab_set()
+        except Exception:
+            pass
+
+    def _close_settings(self):
+        try:
+            self._settings_win.grab_release()
+        except Exception:
+            pass
+        self._settings_win.withdraw()
+
+    def _refresh_settings_entries(self):
+        """Sync the entry fields with the current config"""
+        for entry, value in (
+            (self._vid_entry, self.config.get("vendor_id", "0x0fe6")),
+            (self._pid_entry, self.config.get("product_id", "0x811e")),
+            (self._iface_entry, str(self.config.get("interface", 0))),
+        ):
+            entry.delete(0, "end")
+            entry.insert(0, value)
+
+    def _build_settings_window(self):
+        win = ctk.CTkToplevel(self)
+        win.title("Settings")
+        win.geometry("450x400")
+        win.configure(fg_color=COLORS["bg_dark"])
+        win.resizable(False, False)
+        win.transient(self)
+        win.withdraw()
+        win.protocol("WM_DELETE_WINDOW", self._close_settings)
+        self._settings_win = win
 
         # Title
         title = ctk.CTkLabel(
-            settings_win,
+            win,
             text="PRINTER CONFIGURATION",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_f(14, "bold"),
             text_color=COLORS["text_primary"]
         )
         title.pack(pady=(SPACE["xxl"], SPACE["xl"]))
 
         # Settings container
-        settings_frame = ctk.CTkFrame(settings_win, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
+        settings_frame = ctk.CTkFrame(win, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
         settings_frame.pack(fill="x", padx=SPACE["xxl"], pady=(0, SPACE["xl"]))
 
         settings_inner = ctk.CTkFrame(settings_frame, fg_color="transparent")
@@ -304,86 +537,83 @@ class PrinterApp(ctk.CTk):
         # Vendor ID
         vid_frame = ctk.CTkFrame(settings_inner, fg_color="transparent")
         vid_frame.pack(fill="x", pady=SPACE["sm"])
-        
+
         vid_label = ctk.CTkLabel(
             vid_frame,
             text="VENDOR ID",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"],
             width=120,
             anchor="w"
         )
         vid_label.pack(side="left")
-        
-        vid_entry = ctk.CTkEntry(
+
+        self._vid_entry = ctk.CTkEntry(
             vid_frame,
             width=200,
             height=SPACE["xxl"],
-            font=ctk.CTkFont(size=13),
+            font=_f(13),
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"],
             corner_radius=SPACE["xs"]
         )
-        vid_entry.pack(side="right")
-        vid_entry.insert(0, self.config.get("vendor_id", "0x0fe6"))
+        self._vid_entry.pack(side="right")
 
         # Product ID
         pid_frame = ctk.CTkFrame(settings_inner, fg_color="transparent")
         pid_frame.pack(fill="x", pady=SPACE["sm"])
-        
+
         pid_label = ctk.CTkLabel(
             pid_frame,
             text="PRODUCT ID",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"],
             width=120,
             anchor="w"
         )
         pid_label.pack(side="left")
-        
-        pid_entry = ctk.CTkEntry(
+
+        self._pid_entry = ctk.CTkEntry(
             pid_frame,
             width=200,
             height=SPACE["xxl"],
-            font=ctk.CTkFont(size=13),
+            font=_f(13),
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"],
             corner_radius=SPACE["xs"]
         )
-        pid_entry.pack(side="right")
-        pid_entry.insert(0, self.config.get("product_id", "0x811e"))
+        self._pid_entry.pack(side="right")
 
         # Interface
         iface_frame = ctk.CTkFrame(settings_inner, fg_color="transparent")
         iface_frame.pack(fill="x", pady=SPACE["sm"])
-        
+
         iface_label = ctk.CTkLabel(
             iface_frame,
             text="INTERFACE",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"],
             width=120,
             anchor="w"
         )
         iface_label.pack(side="left")
-        
-        iface_entry = ctk.CTkEntry(
+
+        self._iface_entry = ctk.CTkEntry(
             iface_frame,
             width=200,
             height=SPACE["xxl"],
-            font=ctk.CTkFont(size=13),
+            font=_f(13),
             fg_color=COLORS["bg_dark"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"],
             corner_radius=SPACE["xs"]
         )
-        iface_entry.pack(side="right")
-        iface_entry.insert(0, str(self.config.get("interface", 0)))
+        self._iface_entry.pack(side="right")
 
         # Help text
-        help_frame = ctk.CTkFrame(settings_win, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
+        help_frame = ctk.CTkFrame(win, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
         help_frame.pack(fill="x", padx=SPACE["xxl"], pady=(0, SPACE["xl"]))
 
         help_inner = ctk.CTkFrame(help_frame, fg_color="transparent")
@@ -392,7 +622,7 @@ class PrinterApp(ctk.CTk):
         help_title = ctk.CTkLabel(
             help_inner,
             text="HOW TO FIND PRINTER ID",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["warning"]
         )
         help_title.pack(anchor="w")
@@ -400,89 +630,98 @@ class PrinterApp(ctk.CTk):
         help_text = ctk.CTkLabel(
             help_inner,
             text="Run 'lsusb' in terminal to list USB devices.\nFormat: Bus XXX Device XXX: ID vendor:product",
-            font=ctk.CTkFont(size=11),
+            font=_f(11),
             text_color=COLORS["text_secondary"],
             justify="left"
         )
         help_text.pack(anchor="w", pady=(SPACE["xs"], 0))
 
         # Buttons
-        btn_frame = ctk.CTkFrame(settings_win, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(win, fg_color="transparent")
         btn_frame.pack(fill="x", padx=SPACE["xxl"], pady=(0, SPACE["xxl"]))
 
-        def save_settings():
-            # Validate and save
-            new_vid = vid_entry.get().strip()
-            new_pid = pid_entry.get().strip()
-            new_iface = iface_entry.get().strip()
-            
-            # Validate hex format
-            try:
-                if not new_vid.startswith("0x"):
-                    new_vid = "0x" + new_vid
-                int(new_vid, 16)
-            except:
-                _make_popup(settings_win, "Invalid Input", "Vendor ID harus dalam format hex (contoh: 0x0fe6)", "error")
-                return
-            
-            try:
-                if not new_pid.startswith("0x"):
-                    new_pid = "0x" + new_pid
-                int(new_pid, 16)
-            except:
-                _make_popup(settings_win, "Invalid Input", "Product ID harus dalam format hex (contoh: 0x811e)", "error")
-                return
-            
-            try:
-                new_iface = int(new_iface)
-            except:
-                _make_popup(settings_win, "Invalid Input", "Interface harus berupa angka (contoh: 0)", "error")
-                return
-            
-            # Update config
-            self.config["vendor_id"] = new_vid
-            self.config["product_id"] = new_pid
-            self.config["interface"] = new_iface
-            
-            # Reset printer connection
-            if self.printer is not None:
-                try:
-                    self.printer.close()
-                except:
-                    pass
-                self.printer = None
-            
-            # Save to file
-            if save_config(self.config):
-                _make_popup(settings_win, "Success", "Konfigurasi berhasil disimpan.", "success")
-                settings_win.after(1500, settings_win.destroy)
-            else:
-                _make_popup(settings_win, "Error", "Gagal menyimpan konfigurasi.", "error")
-
         save_btn = ctk.CTkButton(
             btn_frame,
             text="Save",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_f(14, "bold"),
             fg_color=COLORS["success"],
             hover_color=COLORS["success_hover"],
             height=SPACE["xxl"] + SPACE["md"],
             corner_radius=SPACE["sm"],
-            command=save_settings
+            command=self._save_settings
         )
         save_btn.pack(side="left", fill="x", expand=True, padx=(0, SPACE["sm"]))
 
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_f(14, "bold"),
             fg_color=COLORS["border"],
             hover_color=COLORS["bg_sidebar"],
             height=SPACE["xxl"] + SPACE["md"],
             corner_radius=SPACE["sm"],
-            command=settings_win.destroy
+            command=self._close_settings
         )
         cancel_btn.pack(side="right", fill="x", expand=True, padx=(SPACE["sm"], 0))
 
+    def _save_settings(self):
+        win = self._settings_win
+
+        # Validate and save
+        new_vid = self._vid_entry.get().strip()
+        new_pid = self._pid_entry.get().strip()
+        new_iface = self._iface_entry.get().strip()
+
+        # Validate hex format
+        try:
+            if not new_vid.startswith("0x"):
+                new_vid = "0x" + new_vid
+            int(new_vid, 16)
+        except:
+            _make_popup(win, "Invalid Input", "Vendor ID harus dalam format hex (contoh: 0x0fe6)", "error")
+            return
+
+        try:
+            if not new_pid.startswith("0x"):
+                new_pid = "0x" + new_pid
+            int(new_pid, 16)
+        except:
+            _make_popup(win, "Invalid Input", "Product ID harus dalam format hex (contoh: 0x811e)", "error")
+            return
+
+        try:
+            new_iface = int(new_iface)
+        except:
+            _make_popup(win, "Invalid Input", "Interface harus berupa angka (contoh: 0)", "error")
+            return
+
+        # Update config
+        self.config["vendor_id"] = new_vid
+        self.config["product_id"] = new_pid
+        self.config["interface"] = new_iface
+
+        # Reset printer connection
+        if self.printer is not None:
+            try:
+                self.printer.close()
+            except:
+                pass
+            self.printer = None
+
+        # Re-check device presence against the new IDs
+        self._refresh_id_cache()
+        self._usb_pattern_re = None
+        self._reset_usb_poll()
+        if self._udev_observer is not None:
+            self._set_device_status(self._scan_usb_devices())
+
+        # Save to file
+        if save_config(self.config):
+            _make_popup(win, "Success", "Konfigurasi berhasil disimpan.", "success")
+            win.after(1500, self._close_settings)
+        else:
+            _make_popup(win, "Error", "Gagal menyimpan konfigurasi.", "error")
+
     # -----------------------------
     # UI
     # -----------------------------
@@ -503,7 +742,7 @@ class PrinterApp(ctk.CTk):
         brand_text = ctk.CTkLabel(
             brand_frame,
             text="PrinterPro",
-            font=ctk.CTkFont(family="Segoe UI", size=SPACE["xl"], weight="bold"),
+            font=_f(SPACE["xl"], "bold", "Segoe UI"),
             text_color=COLORS["text_primary"]
         )
         brand_text.pack(side="left")
@@ -511,7 +750,7 @@ class PrinterApp(ctk.CTk):
         version_label = ctk.CTkLabel(
             brand_frame,
             text="v1.0",
-            font=ctk.CTkFont(size=10),
+            font=_f(10),
             text_color=COLORS["text_secondary"]
         )
         version_label.pack(side="left", padx=(SPACE["sm"], 0), pady=(SPACE["sm"], 0))
@@ -533,7 +772,7 @@ class PrinterApp(ctk.CTk):
                 sidebar,
                 text=text,
                 anchor="w",
-                font=ctk.CTkFont(size=14),
+                font=_f(14),
                 fg_color="transparent",
                 text_color=COLORS["text_secondary"],
                 hover_color=COLORS["bg_card"],
@@ -555,7 +794,7 @@ class PrinterApp(ctk.CTk):
             sidebar,
             text="Settings",
             anchor="w",
-            font=ctk.CTkFont(size=14),
+            font=_f(14),
             fg_color="transparent",
             text_color=COLORS["text_secondary"],
             hover_color=COLORS["bg_card"],
@@ -575,7 +814,7 @@ class PrinterApp(ctk.CTk):
         status_title = ctk.CTkLabel(
             status_inner,
             text="DEVICE STATUS",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"]
         )
         status_title.pack(anchor="w")
@@ -595,7 +834,7 @@ class PrinterApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             status_row,
             text="Checking...",
-            font=ctk.CTkFont(size=SPACE["lg"], weight="bold"),
+            font=_f(13, "bold"),
             text_color=COLORS["text_secondary"]
         )
         self.status_label.pack(side="left", padx=(SPACE["md"], 0))
@@ -606,7 +845,7 @@ class PrinterApp(ctk.CTk):
         device_id_label = ctk.CTkLabel(
             status_inner,
             text=f"ID: {vid}:{pid}",
-            font=ctk.CTkFont(size=10),
+            font=_f(10),
             text_color=COLORS["text_secondary"]
         )
         device_id_label.pack(anchor="w", pady=(SPACE["xs"], 0))
@@ -624,7 +863,7 @@ class PrinterApp(ctk.CTk):
         self.header_title = ctk.CTkLabel(
             header,
             text="Dashboard",
-            font=ctk.CTkFont(family="Segoe UI", size=SPACE["xl"] + SPACE["sm"], weight="bold"),
+            font=_f(SPACE["xl"] + SPACE["sm"], "bold", "Segoe UI"),
             text_color=COLORS["text_primary"]
         )
         self.header_title.pack(side="left")
@@ -632,39 +871,53 @@ class PrinterApp(ctk.CTk):
         self.header_subtitle = ctk.CTkLabel(
             header,
             text="Overview & Quick Actions",
-            font=ctk.CTkFont(size=SPACE["lg"]),
+            font=_f(13),
             text_color=COLORS["text_secondary"]
         )
         self.header_subtitle.pack(side="left", padx=(SPACE["lg"], 0), pady=(SPACE["sm"], 0))
 
-        # Content area
+        # Content area: all three views are built once and toggled with
+        # grid()/grid_remove() so navigation never rebuilds widgets
         self.content_frame = ctk.CTkFrame(main_content, fg_color="transparent")
         self.content_frame.grid(row=1, column=0, sticky="nsew", padx=SPACE["xxl"], pady=SPACE["xxl"])
-        self.content_frame.grid_columnconfigure((0, 1), weight=1)
-        self.content_frame.grid_rowconfigure((0, 1), weight=1)
-
-        self._show_dashboard()
+        self.content_frame.grid_columnconfigure(0, weight=1)
+        self.content_frame.grid_rowconfigure(0, weight=1)
+
+        self._views = {
+            "dashboard": self._build_dashboard_view(),
+            "manual": self._build_manual_view(),
+            "auto": self._build_auto_view(),
+        }
+        for view in self._views.values():
+            view.grid(row=0, column=0, sticky="nsew")
+            view.grid_remove()
+
+        self._active_view = "dashboard"
+        self._refresh_dashboard()
+        self._views["dashboard"].grid()
 
     def _nav_click(self, key):
         self._set_nav_active(key)
-        
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
 
         if key == "dashboard":
             self.header_title.configure(text="Dashboard")
             self.header_subtitle.configure(text="Overview & Quick Actions")
-            self._show_dashboard()
+            self._refresh_dashboard()
         elif key == "manual":
             self.header_title.configure(text="Manual Mode")
             self.header_subtitle.configure(text="Add counts manually and print")
             self.current_mode = "Manual"
-            self._show_manual()
+            self._update_label()
         elif key == "auto":
             self.header_title.configure(text="Auto Mode")
             self.header_subtitle.configure(text="Automatic counting with configurable settings")
             self.current_mode = "Auto"
-            self._show_auto()
+            self._update_label()
+
+        if key != self._active_view:
+            self._views[self._active_view].grid_remove()
+            self._views[key].grid()
+            self._active_view = key
 
     def _set_nav_active(self, active_key):
         for key, btn in self.nav_buttons.items():
@@ -673,9 +926,13 @@ class PrinterApp(ctk.CTk):
             else:
                 btn.configure(fg_color="transparent", text_color=COLORS["text_secondary"])
 
-    def _show_dashboard(self):
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        stats_frame.grid(row=0, column=0, columnspan=2, sticky="new", pady=(0, SPACE["xl"]))
+    def _build_dashboard_view(self):
+        view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        view.grid_columnconfigure(0, weight=1)
+        view.grid_rowconfigure(1, weight=1)
+
+        stats_frame = ctk.CTkFrame(view, fg_color="transparent")
+        stats_frame.grid(row=0, column=0, sticky="new", pady=(0, SPACE["xl"]))
         stats_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         card1 = self._create_stat_card(stats_frame, "COUNT", "Current Count", str(self.counter), COLORS["accent"])
@@ -688,13 +945,15 @@ class PrinterApp(ctk.CTk):
         card3 = self._create_stat_card(stats_frame, "STATUS", "Device", status_text, COLORS["success"] if self.device_connected else COLORS["accent"])
         card3.grid(row=0, column=2, sticky="ew", padx=(SPACE["md"], 0))
 
-        actions_card = ctk.CTkFrame(self.content_frame, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
-        actions_card.grid(row=1, column=0, columnspan=2, sticky="nsew")
+        self._dash_cards = {"count": card1, "mode": card2, "status": card3}
+
+        actions_card = ctk.CTkFrame(view, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
+        actions_card.grid(row=1, column=0, sticky="nsew")
 
         actions_title = ctk.CTkLabel(
             actions_card,
             text="QUICK ACTIONS",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_f(11, "bold"),
             text_color=COLORS["text_secondary"]
         )
         actions_title.pack(anchor="w", padx=SPACE["xl"], pady=(SPACE["xl"], SPACE["lg"]))
@@ -706,7 +965,7 @@ class PrinterApp(ctk.CTk):
         test_btn = ctk.CTkButton(
             actions_inner,
             text="Test Connection",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_f(14, "bold"),
             fg_color=COLORS["success"],
             hover_color=COLORS["success_hover"],
             height=SPACE["xxxl"],
@@ -718,7 +977,7 @@ class PrinterApp(ctk.CTk):
         print_btn = ctk.CTkButton(
             actions_inner,
             text="Print Receipt",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_f(14, "bold"),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             height=SPACE["xxxl"],
@@ -727,6 +986,20 @@ class PrinterApp(ctk.CTk):
         )
         print_btn.grid(row=0, column=1, sticky="ew", padx=(SPACE["md"], 0), pady=SPACE["sm"])
 
+        return view
+
+    def _refresh_dashboard(self):
+        """Sync the stat cards with current state before showing them"""
+        self._dash_cards["count"].value_label.configure(text=str(self.counter))
+        self._dash_cards["mode"].value_label.configure(text=self.current_mode)
+        status = self._dash_cards["status"]
+        if self.device_connected:
+            status.value_label.configure(text="Connected")
+            status.tag_label.configure(text_color=COLORS["success"])
+        else:
+            status.value_label.configure(text="Disconnected")
+            status.tag_label.configure(text_color=COLORS["accent"])
+
     def _create_stat_card(self, parent, label, title, value, color):
         card_height = int(SPACE["xxxl"] * PHI) + SPACE["xl"]
         card = ctk.CTkFrame(parent, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"], height=card_height)
@@ -738,30 +1011,38 @@ class PrinterApp(ctk.CTk):
         label_lbl = ctk.CTkLabel(
             inner, 
             text=label,
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=color
         )
         label_lbl.pack(anchor="w")
 
         title_lbl = ctk.CTkLabel(
             inner, text=title,
-            font=ctk.CTkFont(size=11),
+            font=_f(11),
             text_color=COLORS["text_secondary"]
         )
         title_lbl.pack(anchor="w", pady=(SPACE["sm"], SPACE["xs"]))
 
         value_lbl = ctk.CTkLabel(
             inner, text=value,
-            font=ctk.CTkFont(size=SPACE["xl"], weight="bold"),
+            font=_f(SPACE["xl"], "bold"),
             text_color=COLORS["text_primary"]
         )
         value_lbl.pack(anchor="w")
 
+        # Kept for _refresh_dashboard so cards update without a rebuild
+        card.tag_label = label_lbl
+        card.value_label = value_lbl
+
         return card
 
-    def _show_manual(self):
-        counter_card = ctk.CTkFrame(self.content_frame, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
-        counter_card.grid(row=0, column=0, columnspan=2, sticky="nsew", pady=(0, SPACE["lg"]))
+    def _build_manual_view(self):
+        view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        view.grid_columnconfigure(0, weight=1)
+        view.grid_rowconfigure(0, weight=1)
+
+        counter_card = ctk.CTkFrame(view, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
+        counter_card.grid(row=0, column=0, sticky="nsew", pady=(0, SPACE["lg"]))
 
         counter_inner = ctk.CTkFrame(counter_card, fg_color="transparent")
         counter_inner.pack(expand=True)
@@ -769,15 +1050,15 @@ class PrinterApp(ctk.CTk):
         counter_title = ctk.CTkLabel(
             counter_inner,
             text="COUNTER",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_f(11, "bold"),
             text_color=COLORS["text_secondary"]
         )
         counter_title.pack(pady=(SPACE["xxl"], SPACE["md"]))
 
         self.manual_counter_label = ctk.CTkLabel(
             counter_inner,
-            text=str(self.counter),
-            font=ctk.CTkFont(family="Consolas", size=89, weight="bold"),
+            textvariable=self._counter_var,
+            font=_f(89, "bold", "Consolas"),
             text_color=COLORS["accent"]
         )
         self.manual_counter_label.pack()
@@ -791,7 +1072,7 @@ class PrinterApp(ctk.CTk):
         add_btn = ctk.CTkButton(
             btn_frame,
             text="+ Add",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_f(15, "bold"),
             fg_color=COLORS["success"],
             hover_color=COLORS["success_hover"],
             width=btn_width,
@@ -804,7 +1085,7 @@ class PrinterApp(ctk.CTk):
         reset_btn = ctk.CTkButton(
             btn_frame,
             text="Reset",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_f(15, "bold"),
             fg_color=COLORS["border"],
             hover_color=COLORS["bg_sidebar"],
             width=btn_width,
@@ -817,7 +1098,7 @@ class PrinterApp(ctk.CTk):
         print_btn = ctk.CTkButton(
             btn_frame,
             text="Print",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_f(15, "bold"),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             width=btn_width,
@@ -827,9 +1108,15 @@ class PrinterApp(ctk.CTk):
         )
         print_btn.pack(side="left", padx=SPACE["md"])
 
-    def _show_auto(self):
-        auto_card = ctk.CTkFrame(self.content_frame, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
-        auto_card.grid(row=0, column=0, columnspan=2, sticky="nsew")
+        return view
+
+    def _build_auto_view(self):
+        view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        view.grid_columnconfigure(0, weight=1)
+        view.grid_rowconfigure(0, weight=1)
+
+        auto_card = ctk.CTkFrame(view, fg_color=COLORS["bg_card"], corner_radius=SPACE["md"])
+        auto_card.grid(row=0, column=0, sticky="nsew")
 
         auto_inner = ctk.CTkFrame(auto_card, fg_color="transparent")
         auto_inner.pack(expand=True)
@@ -837,7 +1124,7 @@ class PrinterApp(ctk.CTk):
         auto_title = ctk.CTkLabel(
             auto_inner,
             text="AUTO COUNTER",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_f(11, "bold"),
             text_color=COLORS["text_secondary"]
         )
         auto_title.pack(pady=(SPACE["xl"], SPACE["md"]))
@@ -854,24 +1141,26 @@ class PrinterApp(ctk.CTk):
         max_label = ctk.CTkLabel(
             max_frame,
             text="MAX COUNT",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"]
         )
         max_label.pack(anchor="w")
 
+        self._max_var = tk.StringVar(value=str(self.auto_max_count))
         self.max_count_entry = ctk.CTkEntry(
             max_frame,
             width=89,
             height=SPACE["xxl"],
-            font=ctk.CTkFont(size=14),
+            font=_f(14),
             fg_color=COLORS["bg_card"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"],
+            textvariable=self._max_var,
             justify="center",
             corner_radius=SPACE["xs"]
         )
         self.max_count_entry.pack(pady=(SPACE["xs"], 0))
-        self.max_count_entry.insert(0, str(self.auto_max_count))
+        self._max_var.trace_add("write", self._on_max_changed)
 
         interval_frame = ctk.CTkFrame(settings_inner, fg_color="transparent")
         interval_frame.pack(side="left", padx=SPACE["xl"])
@@ -879,29 +1168,31 @@ class PrinterApp(ctk.CTk):
         interval_label = ctk.CTkLabel(
             interval_frame,
             text="INTERVAL (SEC)",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=_f(10, "bold"),
             text_color=COLORS["text_secondary"]
         )
         interval_label.pack(anchor="w")
 
+        self._interval_var = tk.StringVar(value=str(self.auto_interval))
         self.interval_entry = ctk.CTkEntry(
             interval_frame,
             width=89,
             height=SPACE["xxl"],
-            font=ctk.CTkFont(size=14),
+            font=_f(14),
             fg_color=COLORS["bg_card"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"],
+            textvariable=self._interval_var,
             justify="center",
             corner_radius=SPACE["xs"]
         )
         self.interval_entry.pack(pady=(SPACE["xs"], 0))
-        self.interval_entry.insert(0, str(self.auto_interval))
+        self._interval_var.trace_add("write", self._on_interval_changed)
 
         self.auto_counter_label = ctk.CTkLabel(
             auto_inner,
-            text=str(self.counter),
-            font=ctk.CTkFont(family="Consolas", size=89, weight="bold"),
+            textvariable=self._counter_var,
+            font=_f(89, "bold", "Consolas"),
             text_color=COLORS["warning"]
         )
         self.auto_counter_label.pack(pady=(SPACE["md"], 0))
@@ -909,7 +1200,7 @@ class PrinterApp(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             auto_inner,
             text="Ready to start",
-            font=ctk.CTkFont(size=SPACE["lg"]),
+            font=_f(13),
             text_color=COLORS["text_secondary"]
         )
         self.progress_label.pack(pady=(SPACE["md"], SPACE["lg"]))
@@ -928,7 +1219,7 @@ class PrinterApp(ctk.CTk):
         self.btn_auto = ctk.CTkButton(
             auto_inner,
             text="Start",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_f(15, "bold"),
             fg_color=COLORS["success"],
             hover_color=COLORS["success_hover"],
             width=200,
@@ -938,16 +1229,77 @@ class PrinterApp(ctk.CTk):
         )
         self.btn_auto.pack(pady=(0, SPACE["xl"]))
 
+        # These widgets never change size after their first layout pass;
+        # dropping their <Configure> binding stops CustomTkinter from
+        # re-rasterizing them on every geometry notification. The big
+        # counter label is NOT frozen: it grows when the count gains a
+        # digit. The view starts grid_remove()'d, so freezing waits for
+        # its first <Map> rather than racing the initial layout
+        self._auto_static_widgets = (
+            max_label,
+            interval_label,
+            self.max_count_entry,
+            self.interval_entry,
+        )
+        self._auto_map_bind = tk.Misc.bind(view, "<Map>", self._on_auto_first_map, "+")
+
+        return view
+
+    def _on_auto_first_map(self, event):
+        """Freeze the static widgets once the auto view is first shown"""
+        tk.Misc.unbind(event.widget, "<Map>", self._auto_map_bind)
+        # Let the freshly mapped layout settle before unbinding
+        self.after_idle(self._freeze_static_widgets, self._auto_static_widgets)
+
+    def _freeze_static_widgets(self, widgets):
+        """Unbind <Configure> on fixed-size widgets once laid out"""
+        for w in widgets:
+            try:
+                # CustomTkinter overrides unbind() to target the inner
+                # canvas/label/entry children, but the binding that
+                # drives _update_dimensions_event lives on the outer
+                # widget - unbind there via the plain tkinter method.
+                # Safe for these widgets: the window is not resizable
+                # and scaling never changes after startup, so their
+                # geometry is final once packed
+                tk.Misc.unbind(w, "<Configure>")
+            except Exception:
+                pass
+
     def _reset_counter(self):
         self.counter = 0
-        if hasattr(self, 'manual_counter_label') and self.manual_counter_label.winfo_exists():
-            self.manual_counter_label.configure(text="0")
+        self._update_label()
+
+    # Entry values are parsed as the user types, so Start is a pure read
+    # of auto_max_count/auto_interval; bad input keeps the last good
+    # value and flags the entry with a red border
+    def _on_max_changed(self, *_):
+        try:
+            v = int(self._max_var.get())
+            if v < 1:
+                raise ValueError
+            self.auto_max_count = v
+            self.max_count_entry.configure(border_color=COLORS["border"])
+        except ValueError:
+            self.max_count_entry.configure(border_color=COLORS["accent"])
+
+    def _on_interval_changed(self, *_):
+        try:
+            v = float(self._interval_var.get())
+            if v < 0.1:
+                raise ValueError
+            self.auto_interval = v
+            self.interval_entry.configure(border_color=COLORS["border"])
+        except ValueError:
+            self.interval_entry.configure(border_color=COLORS["accent"])
 
     def _update_label(self):
-        if hasattr(self, 'manual_counter_label') and self.manual_counter_label.winfo_exists():
-            self.manual_counter_label.configure(text=str(self.counter))
-        if hasattr(self, 'auto_counter_label') and self.auto_counter_label.winfo_exists():
-            self.auto_counter_label.configure(text=str(self.counter))
+        # One StringVar drives both counter labels, so a single set()
+        # updates them without going through widget configure()
+        try:
+            self._counter_var.set(str(self.counter))
+        except tk.TclError:
+            pass
 
     def _manual_add(self):
         self.counter += 1
@@ -955,235 +1307,292 @@ class PrinterApp(ctk.CTk):
 
     def _toggle_auto(self):
         if not self.auto_running:
-            try:
-                max_count = int(self.max_count_entry.get())
-                if max_count < 1:
-                    max_count = 1
-                self.auto_max_count = max_count
-            except (ValueError, AttributeError):
-                self.auto_max_count = 10
-            
-            try:
-                interval = float(self.interval_entry.get())
-                if interval < 0.1:
-                    interval = 0.1
-                self.auto_interval = interval
-            except (ValueError, AttributeError):
-                self.auto_interval = 1.0
-            
-            if hasattr(self, 'max_count_entry') and self.max_count_entry.winfo_exists():
-                self.max_count_entry.configure(state="disabled")
-            if hasattr(self, 'interval_entry') and self.interval_entry.winfo_exists():
-                self.interval_entry.configure(state="disabled")
+            # auto_max_count/auto_interval are kept valid by the entry
+            # traces, so there is nothing to parse here
+            self.max_count_entry.configure(state="disabled")
+            self.interval_entry.configure(state="disabled")
             
             self.auto_running = True
             self.counter = 0
+            self._auto_disc_ticks = 0
             self._update_label()
             self._stopped_by_user = False
-            with self._ui_lock:
-                self.print_scheduled = False
             self.btn_auto.configure(
-                text="Stop", 
-                fg_color=COLORS["accent"], 
+                text="Stop",
+                fg_color=COLORS["accent"],
                 hover_color=COLORS["accent_hover"]
             )
             self.progress_label.configure(text=f"Counting to {self.auto_max_count}...", text_color=COLORS["warning"])
-            t = threading.Thread(target=self._auto_worker, daemon=True)
-            t.start()
-            self.auto_thread = t
+            self._last_frac = -1
+            self._last_progress_txt = None
+            # Start from fresh device state, not a backed-off poll
+            self._reset_usb_poll()
+            self._auto_deadline = time.perf_counter()
+            self._auto_tick()
         else:
             self._stopped_by_user = True
             self.auto_running = False
+            if self._auto_after_id is not None:
+                self.after_cancel(self._auto_after_id)
+                self._auto_after_id = None
             self.btn_auto.configure(state="disabled")
+            self._finish_auto()
 
-    def _auto_worker(self):
-        try:
-            i = 0
-            max_count = self.auto_max_count
-            interval = self.auto_interval
-            
-            while self.auto_running and i < max_count:
-                i += 1
-                self.after(0, lambda v=i, m=max_count: self._set_counter_from_thread(v, m))
-                time.sleep(interval)
-
-            with self._ui_lock:
-                if not self.print_scheduled:
-                    self.print_scheduled = True
-                    self.after(0, self._print_and_reset)
-        except Exception as e:
-            err_msg = str(e)
-            self.after(0, lambda: _make_popup(self, "Auto Error", f"Terjadi error pada proses otomatis:\n{err_msg}", "error"))
-        finally:
+    def _auto_tick(self):
+        """One auto-mode count step, driven by Tk's timer"""
+        if not self.auto_running:
+            return
+        if not self.device_connected and self._udev_observer is not None:
+            # Pause counting while unplugged; give up after three misses
+            # rather than hammering Usb() and spamming error popups.
+            # Like the print gates, only udev is trusted here: the
+            # lsusb poll can lag a replug by a full backoff cycle
+            self._auto_disc_ticks += 1
+            if self._auto_disc_ticks >= 3:
+                self.auto_running = False
+                self._auto_after_id = None
+                self._auto_cleanup_ui()
+                self.progress_label.configure(text="Device disconnected", text_color=COLORS["accent"])
+                return
+            self._schedule_next_tick()
+            return
+        self._auto_disc_ticks = 0
+        self._set_counter_from_thread(self.counter + 1, self.auto_max_count)
+        if self.counter < self.auto_max_count:
+            self._schedule_next_tick()
+        else:
             self.auto_running = False
-            self.after(0, self._auto_cleanup_ui)
+            self._finish_auto()
+
+    def _schedule_next_tick(self):
+        """Schedule the next tick against a monotonic deadline.
+
+        A bare after(interval) chain drifts: each tick adds Tk timer
+        slack plus callback time, which is visible over long sessions.
+        Advancing a perf_counter deadline and sleeping the remainder
+        keeps tick N at start + N*interval.
+        """
+        self._auto_deadline += self.auto_interval
+        delay = self._auto_deadline - time.perf_counter()
+        self._auto_after_id = self.after(max(1, int(delay * 1000)), self._auto_tick)
+
+    def _finish_auto(self):
+        """Finalize a session: print on completion, then restore the UI"""
+        self._auto_after_id = None
+        if self._stopped_by_user:
+            # Stopped early: reset without submitting a print job
+            self.counter = 0
+            self._update_label()
+            try:
+                self.progress_bar.set(0)
+            except tk.TclError:
+                pass
+            self._auto_cleanup_ui()
+            self.progress_label.configure(text="Stopped", text_color=COLORS["accent"])
+        else:
+            self._print_and_reset()
+            self._auto_cleanup_ui()
 
     def _print_and_reset(self):
         self._safe_print_call()
         self.counter = 0
         self._update_label()
-        if hasattr(self, 'progress_bar') and self.progress_bar.winfo_exists():
+        try:
             self.progress_bar.set(0)
+        except tk.TclError:
+            pass
+
+    # Minimum seconds between visible tick updates; decouples redraw
+    # rate from tick rate so tight intervals can't starve user input
+    _UI_MIN_DT = 0.05
 
     def _set_counter_from_thread(self, v, max_count=10):
         self.counter = v
-        self._update_label()
-        if hasattr(self, 'progress_bar') and self.progress_bar.winfo_exists():
-            self.progress_bar.set(v / max_count)
-        if hasattr(self, 'progress_label') and self.progress_label.winfo_exists():
-            self.progress_label.configure(text=f"Counting: {v}/{max_count}")
+        now = time.monotonic()
+        if v != max_count and now - self._last_ui_flush < self._UI_MIN_DT:
+            return
+        self._last_ui_flush = now
+        # Each configure/set triggers a CustomTkinter redraw, so skip
+        # the ones whose value hasn't actually changed; the counter
+        # labels update through their shared StringVar
+        try:
+            self._counter_var.set(str(v))
+            frac = round(v / max_count, 2)
+            if frac != getattr(self, "_last_frac", -1):
+                self.progress_bar.set(frac)
+                self._last_frac = frac
+            txt = f"Counting: {v}/{max_count}"
+            if getattr(self, "_last_progress_txt", None) != txt:
+                self.progress_label.configure(text=txt)
+                self._last_progress_txt = txt
+        except tk.TclError:
+            pass
 
     def _auto_cleanup_ui(self):
         try:
-            if hasattr(self, 'max_count_entry') and self.max_count_entry.winfo_exists():
-                self.max_count_entry.configure(state="normal")
-            if hasattr(self, 'interval_entry') and self.interval_entry.winfo_exists():
-                self.interval_entry.configure(state="normal")
-            
-            if hasattr(self, 'btn_auto') and self.btn_auto.winfo_exists():
-                self.btn_auto.configure(
-                    state="normal", 
-                    text="Start",
-                    fg_color=COLORS["success"],
-                    hover_color=COLORS["success_hover"]
-                )
-            if hasattr(self, 'progress_label') and self.progress_label.winfo_exists():
-                self.progress_label.configure(text="Complete", text_color=COLORS["success"])
-        except Exception:
+            self.max_count_entry.configure(state="normal")
+            self.interval_entry.configure(state="normal")
+            self.btn_auto.configure(
+                state="normal",
+                text="Start",
+                fg_color=COLORS["success"],
+                hover_color=COLORS["success_hover"]
+            )
+            self.progress_label.configure(text="Complete", text_color=COLORS["success"])
+        except tk.TclError:
             pass
 
+    def _printer_worker(self):
+        """Consume print jobs one at a time (runs on the printer thread)"""
+        while True:
+            job = self._print_q.get()
+            if job is None:  # shutdown sentinel from _on_close
+                break
+            self._printer_state = "busy"
+            try:
+                if job[0] == "count":
+                    self.print_count(job[1], job[2])
+                elif job[0] == "test":
+                    self.test_print(job[1])
+            except Exception:
+                pass
+            finally:
+                self._printer_state = "idle"
+                self._print_q.task_done()
+
+    def _on_close(self):
+        """Unblock the printer worker before tearing the window down"""
+        self._print_q.put(None)
+        self.destroy()
+
+    def _printer_busy(self):
+        """True while a print job is queued or being transmitted"""
+        if self._printer_state == "busy" or not self._print_q.empty():
+            _make_popup(self, "Info", "Proses cetak sedang berjalan. Mohon tunggu.", "info")
+            return True
+        return False
+
     def _safe_print_call(self):
-        if threading.current_thread() is threading.main_thread():
-            self.print_count()
-        else:
-            self.after(0, self.print_count)
+        self._reset_usb_poll()
+        # Only refuse when udev - which sees hotplug events as they
+        # happen - says the device is gone. The lsusb fallback can lag
+        # behind a replug (or be missing entirely), so there we fall
+        # through and let connect_printer() report failure itself
+        if not self.device_connected and self._udev_observer is not None:
+            _make_popup(self, "Printer", "Printer tidak terdeteksi. Periksa koneksi USB.", "error")
+            return
+        if self._printer_busy():
+            return
+        # Capture counter and timestamp now: the receipt should reflect
+        # the moment of the press, not when the worker gets to the job
+        ts = time.strftime("%d-%m-%Y %H:%M:%S")
+        self._print_q.put(("count", self.counter, ts))
 
     def _safe_test_print_call(self):
-        if threading.current_thread() is threading.main_thread():
-            self.test_print()
-        else:
-            self.after(0, self.test_print)
-
-    def print_count(self):
-        if not self.print_lock.acquire(blocking=False):
-            _make_popup(self, "Info", "Proses cetak sedang berjalan. Mohon tunggu.", "info")
+        self._reset_usb_poll()
+        if not self.device_connected and self._udev_observer is not None:
+            _make_popup(self, "Printer", "Printer tidak terdeteksi. Periksa koneksi USB.", "error")
             return
+        if self._printer_busy():
+            return
+        ts = time.strftime("%d-%m-%Y %H:%M:%S")
+        self._print_q.put(("test", ts))
 
+    def print_count(self, count, ts):
+        # Only ever called by the printer worker; the single-consumer
+        # queue serializes prints, so no lock is needed here
         try:
             if not self.connect_printer():
                 return
 
             p = self.printer
-            ts = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-            order_id = int(time.time())
-
-            try:
-                p.set(align="center", width=2, height=2)
-            except Exception:
-                try:
+            order_id = next(self._order_seq)
+
+            if self._supports_raw:
+                # ESC/POS is a stateful byte stream, so the whole
+                # receipt - styles, text and cut - fits in one write
+                buf = bytearray()
+                buf += ESC_ALIGN_C + ESC_SIZE_2 + RCPT_TITLE + ESC_SIZE_1
+                buf += RCPT_SEP + b"\n"
+                buf += ESC_ALIGN_L
+                buf += f"Tanggal : {ts}\nNomor   : #{order_id}\n".encode('cp437', 'replace')
+                buf += RCPT_SEP
+                buf += ESC_BOLD_ON
+                buf += f"Hasil Hitungan : {count}\n".encode('cp437', 'replace')
+                buf += ESC_BOLD_OFF
+                buf += RCPT_SEP + b"\n"
+                buf += ESC_ALIGN_C + RCPT_FOOTER
+                buf += ESC_CUT
+                p._raw(bytes(buf))
+            else:
+                if self._supports_setsize:
+                    p.set(align="center", width=2, height=2)
+                else:
                     p.set(align="center")
+                p.text("LAPORAN HITUNGAN\n")
+                if self._supports_setsize:
+                    p.set(width=1, height=1)
+                p.text("-------------------------\n\n")
+                p.set(align="left")
+                p.text(
+                    f"Tanggal : {ts}\n"
+                    f"Nomor   : #{order_id}\n"
+                    "-------------------------\n"
+                    f"Hasil Hitungan : {count}\n"
+                    "-------------------------\n\n"
+                )
+                p.set(align="center")
+                p.text("Terima kasih!\nDicetak oleh PrinterPro\n\n")
+                try:
+                    p.cut()
                 except Exception:
                     pass
 
-            try:
-                p._raw(b'\x1b\x45\x01')
-                p.text("LAPORAN HITUNGAN\n")
-                p._raw(b'\x1b\x45\x00')
-            except Exception:
-                p.text("LAPORAN HITUNGAN\n")
-
-            try:
-                p.set(width=1, height=1)
-            except Exception:
-                pass
-
-            p.text("-------------------------\n\n")
-
-            p.set(align="left")
-            p.text(f"Tanggal : {ts}\n")
-            p.text(f"Nomor   : #{order_id}\n")
-            p.text("-------------------------\n")
-
-            try:
-                p._raw(b'\x1b\x45\x01')
-                p.text(f"Hasil Hitungan : {self.counter}\n")
-                p._raw(b'\x1b\x45\x00')
-            except Exception:
-                p.text(f"Hasil Hitungan : {self.counter}\n")
-
-            p.text("-------------------------\n\n")
-
-            p.set(align="center")
-            p.text("Terima kasih!\n")
-            p.text("Dicetak oleh PrinterPro\n\n")
-
-            try:
-                p.cut()
-            except Exception:
-                pass
-
-            _make_popup(self, "Success", "Struk berhasil dicetak.", "success")
+            self.after(0, _make_popup, self, "Success", "Struk berhasil dicetak.", "success")
         except Exception as e:
             err_msg = str(e)
-            _make_popup(self, "Print Error", f"Gagal mencetak:\n{err_msg}", "error")
-        finally:
-            try:
-                self.print_lock.release()
-            except Exception:
-                pass
-
-    def test_print(self):
-        if not self.print_lock.acquire(blocking=False):
-            _make_popup(self, "Info", "Proses cetak sedang berjalan. Mohon tunggu.", "info")
-            return
+            self.after(0, _make_popup, self, "Print Error", f"Gagal mencetak:\n{err_msg}", "error")
 
+    def test_print(self, ts):
         try:
             if not self.connect_printer():
                 return
 
             p = self.printer
-            ts = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
 
-            try:
-                p.set(align="center", width=2, height=2)
-            except Exception:
-                try:
+            if self._supports_raw:
+                buf = bytearray()
+                buf += ESC_ALIGN_C + ESC_SIZE_2 + TEST_TITLE + ESC_SIZE_1
+                buf += b"---------------------\n\n"
+                buf += ESC_ALIGN_L
+                buf += f"Waktu : {ts}\nPrinter: BT-58D\nStatus : OK\n\n".encode('cp437', 'replace')
+                buf += ESC_ALIGN_C + TEST_OK
+                buf += ESC_CUT
+                p._raw(bytes(buf))
+            else:
+                if self._supports_setsize:
+                    p.set(align="center", width=2, height=2)
+                else:
                     p.set(align="center")
+                p.text("TEST PRINT\n")
+                p.text("---------------------\n\n")
+                p.set(align="left")
+                p.text(
+                    f"Waktu : {ts}\n"
+                    "Printer: BT-58D\n"
+                    "Status : OK\n\n"
+                )
+                p.set(align="center")
+                p.text("Test berhasil!\n\n")
+                try:
+                    p.cut()
                 except Exception:
                     pass
 
-            try:
-                p._raw(b'\x1b\x45\x01')
-                p.text("TEST PRINT\n")
-                p._raw(b'\x1b\x45\x00')
-            except Exception:
-                p.text("TEST PRINT\n")
-
-            p.text("---------------------\n\n")
-            p.set(align="left")
-            p.text(f"Waktu : {ts}\n")
-            p.text("Printer: BT-58D\n")
-            p.text("Status : OK\n\n")
-            p.set(align="center")
-            p._raw(b'\x1b\x45\x01')
-            p.text("Test berhasil!\n")
-            p._raw(b'\x1b\x45\x00')
-            p.text("\n")
-
-            try:
-                p.cut()
-            except Exception:
-                pass
-
-            _make_popup(self, "Success", "Test print berhasil.", "success")
+            self.after(0, _make_popup, self, "Success", "Test print berhasil.", "success")
         except Exception as e:
             err_msg = str(e)
-            _make_popup(self, "Print Error", f"Gagal mencetak:\n{err_msg}", "error")
-        finally:
-            try:
-                self.print_lock.release()
-            except Exception:
-                pass
+            self.after(0, _make_popup, self, "Print Error", f"Gagal mencetak:\n{err_msg}", "error")
 
 # -------------------------------
 # Run